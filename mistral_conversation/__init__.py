@@ -3,9 +3,13 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass, field
+from importlib.util import find_spec
 from pathlib import Path
 from types import MappingProxyType
 
+import httpx
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigSubentry
@@ -13,8 +17,9 @@ from homeassistant.const import CONF_API_KEY, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError, ServiceValidationError, ConfigEntryAuthFailed
 from homeassistant.helpers import config_validation as cv, device_registry as dr, entity_registry as er, selector
-from homeassistant.helpers.httpx_client import get_async_client
+from homeassistant.helpers.httpx_client import SERVER_SOFTWARE, USER_AGENT
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.ssl import get_default_context
 
 from .const import (
     CONF_FILENAMES,
@@ -26,6 +31,7 @@ from .const import (
     RECOMMENDED_AI_TASK_OPTIONS,
     RECOMMENDED_CONVERSATION_OPTIONS,
 )
+from .cache import LLMCache
 from .entity import MistralBaseLLMEntity, _build_messages
 from .mistral_client import MistralClient
 
@@ -33,6 +39,46 @@ PLATFORMS = (Platform.CONVERSATION, Platform.AI_TASK)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it.
+HTTP2_SUPPORTED = find_spec("h2") is not None
+# Idle connections stay open long enough to span a short voice exchange
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=40, keepalive_expiry=30
+)
+
+GENERATE_CONTENT_SCHEMA = vol.Schema(
+    {
+        vol.Required("config_entry"): selector.ConfigEntrySelector(
+            {
+                "integration": DOMAIN,
+            }
+        ),
+        vol.Required(CONF_PROMPT): cv.string,
+        vol.Optional(CONF_FILENAMES, default=[]): vol.All(
+            cv.ensure_list, [cv.string]
+        ),
+    }
+)
+
+
+@dataclass
+class MistralRuntimeData:
+    """Runtime data of a Mistral config entry."""
+
+    client: MistralClient
+    # Config subentries, indexed by subentry type
+    subentries_by_type: dict[str, list[ConfigSubentry]] = field(default_factory=dict)
+
+
+def _read_file(filename: str) -> str:
+    """Read an attached prompt file as UTF-8 regardless of the host locale."""
+    try:
+        return Path(filename).read_text(encoding="utf-8")
+    except UnicodeDecodeError as err:
+        raise HomeAssistantError(
+            f"Cannot read `{filename}`; it is not valid UTF-8 text"
+        ) from err
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Mistral services."""
@@ -47,65 +93,54 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 translation_placeholders={"config_entry": entry_id},
             )
 
+        runtime_data: MistralRuntimeData = entry.runtime_data
+        client = runtime_data.client
         conversation_subentry = next(
-            (
-                sub
-                for sub in entry.subentries.values()
-                if sub.subentry_type == "conversation"
-            ),
-            None,
+            iter(runtime_data.subentries_by_type.get("conversation", ())), None
         )
         if not conversation_subentry:
             raise ServiceValidationError("No conversation configuration found")
 
-        client: MistralClient = entry.runtime_data
-        messages = [
-            {"role": "system", "content": conversation_subentry.data.get(CONF_PROMPT)},
-            {"role": "user", "content": call.data[CONF_PROMPT]},
-        ]
-
+        contents: list[str] = []
         if filenames := call.data.get(CONF_FILENAMES):
             for filename in filenames:
                 if not hass.config.is_allowed_path(filename):
                     raise HomeAssistantError(
                         f"Cannot read `{filename}`; adjust allowlist_external_dirs"
                     )
-                content = await hass.async_add_executor_job(Path(filename).read_text)
-                messages.append(
-                    {
-                        "role": "user",
-                        "content": content,
-                    }
+            contents = await asyncio.gather(
+                *(
+                    hass.async_add_executor_job(_read_file, filename)
+                    for filename in filenames
                 )
+            )
 
-        response = await client.chat(
+        messages = [
+            {"role": "system", "content": conversation_subentry.data.get(CONF_PROMPT)},
+            {"role": "user", "content": call.data[CONF_PROMPT]},
+            *({"role": "user", "content": content} for content in contents),
+        ]
+
+        parts: list[str] = []
+        async for chunk in client.chat_stream(
             {
                 "model": conversation_subentry.data.get(
                     "chat_model", "mistral-large-latest"
                 ),
                 "messages": messages,
-                "stream": False,
+                "stream": True,
             }
-        )
-        return {"text": response["choices"][0]["message"]["content"]}
+        ):
+            for choice in chunk.get("choices", []):
+                if content := (choice.get("delta") or {}).get("content"):
+                    parts.append(content)
+        return {"text": "".join(parts)}
 
     hass.services.async_register(
         DOMAIN,
         "generate_content",
         send_prompt,
-        schema=vol.Schema(
-            {
-                vol.Required("config_entry"): selector.ConfigEntrySelector(
-                    {
-                        "integration": DOMAIN,
-                    }
-                ),
-                vol.Required(CONF_PROMPT): cv.string,
-                vol.Optional(CONF_FILENAMES, default=[]): vol.All(
-                    cv.ensure_list, [cv.string]
-                ),
-            }
-        ),
+        schema=GENERATE_CONTENT_SCHEMA,
         supports_response=SupportsResponse.ONLY,
     )
 
@@ -115,20 +150,41 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up a config entry."""
     api_key = entry.data[CONF_API_KEY]
-    client = MistralClient(api_key, get_async_client(hass))
+    # Dedicated pooled client so chat turns reuse the same connection
+    # A plain httpx client, since HA's factory fixes its own limits and turns
+    # aclose() into a no-op; it reuses HA's SSL context and user agent
+    http_client = httpx.AsyncClient(
+        http2=HTTP2_SUPPORTED,
+        limits=HTTP_LIMITS,
+        verify=get_default_context(),
+        headers={USER_AGENT: SERVER_SOFTWARE},
+    )
+    # Also runs when setup fails below, so the client never leaks
+    entry.async_on_unload(http_client.aclose)
+    client = MistralClient(api_key, http_client, LLMCache())
     
     # Validate API key on setup
     try:
         await client.validate_api_key()
+    except httpx.HTTPStatusError as err:
+        if err.response.status_code == 401:
+            raise ConfigEntryAuthFailed("Invalid API key") from err
+        raise ConfigEntryNotReady(f"Failed to validate API key: {err}") from err
     except Exception as err:
-        import httpx
-        if isinstance(err, httpx.HTTPStatusError):
-            if err.response.status_code == 401:
-                raise ConfigEntryAuthFailed("Invalid API key") from err
-            raise ConfigEntryNotReady(f"Failed to validate API key: {err}") from err
         raise ConfigEntryNotReady(f"Failed to connect to Mistral API: {err}") from err
     
-    entry.runtime_data = client
+    entry.runtime_data = runtime_data = MistralRuntimeData(client)
+    # A key already checked by the config flow skips the request above, so
+    # open this entry's connection before the first chat turn needs it. It
+    # only helps a turn within HTTP_LIMITS' 30 s keep-alive of setup.
+    entry.async_create_background_task(
+        hass, client.warm_up(), f"{DOMAIN} preconnect"
+    )
+    # Subentry changes reload the entry, so the index is rebuilt on every setup
+    for subentry in entry.subentries.values():
+        runtime_data.subentries_by_type.setdefault(subentry.subentry_type, []).append(
+            subentry
+        )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_update_options))
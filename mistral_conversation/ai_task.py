@@ -3,9 +3,8 @@
 
 from __future__ import annotations
 
-import json
-from json import JSONDecodeError
-
+import orjson
+import voluptuous as vol
 from voluptuous_openapi import convert
 
 from homeassistant.components import ai_task, conversation
@@ -18,6 +17,18 @@ from homeassistant.helpers import llm
 from .entity import MistralBaseLLMEntity
 
 
+def _schema_prompt(structure: vol.Schema) -> str:
+    """Return the structured-output instruction for a task schema."""
+    schema_dict = convert(
+        structure,
+        custom_serializer=llm.selector_serializer,
+    )
+    return (
+        "Return your final answer strictly as JSON matching this schema:\n"
+        f"{orjson.dumps(schema_dict, option=orjson.OPT_INDENT_2).decode()}"
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -47,24 +58,10 @@ class MistralAITaskEntity(ai_task.AITaskEntity, MistralBaseLLMEntity):
         """Handle a structured data task."""
         structure_prompt: str | None = None
         if task.structure is not None:
-            schema_dict = convert(
-                task.structure,
-                custom_serializer=llm.selector_serializer,
-            )
-            structure_prompt = (
-                "Return your final answer strictly as JSON matching this schema:\n"
-                f"{json.dumps(schema_dict, indent=2)}"
-            )
-
-        await self._async_handle_chat_log(self.hass, chat_log, structure_prompt)
+            structure_prompt = _schema_prompt(task.structure)
 
-        last_assistant = next(
-            (
-                content
-                for content in reversed(chat_log.content)
-                if isinstance(content, conversation.AssistantContent)
-            ),
-            None,
+        last_assistant = await self._async_handle_chat_log(
+            self.hass, chat_log, structure_prompt
         )
         if not last_assistant:
             raise HomeAssistantError("LLM did not return a response")
@@ -77,8 +74,8 @@ class MistralAITaskEntity(ai_task.AITaskEntity, MistralBaseLLMEntity):
             )
 
         try:
-            data = json.loads(text)
-        except JSONDecodeError as err:
+            data = orjson.loads(text)
+        except orjson.JSONDecodeError as err:
             raise HomeAssistantError("Structured response was not valid JSON") from err
 
         return ai_task.GenDataTaskResult(
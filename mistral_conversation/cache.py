@@ -0,0 +1,55 @@
+"""Response cache for deterministic Mistral requests."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import time
+from typing import Any
+
+import orjson
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CACHE_TTL = 3600
+
+
+class LLMCache:
+    """In-memory LRU cache with a TTL for temperature=0 responses."""
+
+    def __init__(
+        self, maxsize: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    @staticmethod
+    def cache_key(payload: dict[str, Any]) -> str | None:
+        """Return the key for a payload, or None if the reply is not deterministic."""
+        if payload.get("temperature") != 0:
+            return None
+        encoded = orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Return a cached response, dropping it if it has expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
@@ -4,24 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 import logging
+import httpx
 import voluptuous as vol
-# Oben bei den Importen in config_flow.py sicherstellen:
-from homeassistant.helpers.selector import (
-    NumberSelector,
-    NumberSelectorConfig,
-    SelectOptionDict,
-    SelectSelector,
-    SelectSelectorConfig,
-    SelectSelectorMode,
-    TemplateSelector,
-    EntitySelector,        # Neu
-    EntitySelectorConfig,  # Neu
-)
-from .const import (
-    # ... deine anderen consts
-    CONF_DEFAULT_MEDIA_PLAYER,
-    DEFAULT_VOICE_BOX,
-)
 
 from homeassistant.config_entries import (
     ConfigEntry,
@@ -36,6 +20,8 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import llm
 from homeassistant.helpers.httpx_client import get_async_client
 from homeassistant.helpers.selector import (
+    EntitySelector,
+    EntitySelectorConfig,
     NumberSelector,
     NumberSelectorConfig,
     SelectOptionDict,
@@ -81,17 +67,57 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Selectors are stateless, so every form render shares the same instances.
+_CHAT_MODEL_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=list(CHAT_MODELS), # Nutzt unsere Liste aus const.py
+        mode=SelectSelectorMode.DROPDOWN,
+        custom_value=True, # Erlaubt trotzdem eigene Eingaben, falls Mistral ein neues Modell bringt
+    )
+)
+_PROMPT_SELECTOR = TemplateSelector()
+_MEDIA_PLAYER_SELECTOR = EntitySelector(EntitySelectorConfig(domain="media_player"))
+_TOP_P_SELECTOR = NumberSelector(NumberSelectorConfig(min=0, max=1, step=0.05))
+_TEMPERATURE_SELECTOR = NumberSelector(NumberSelectorConfig(min=0, max=2, step=0.05))
+_REASONING_EFFORT_SELECTOR = SelectSelector(
+    SelectSelectorConfig(
+        options=["low", "medium", "high"],
+        translation_key=CONF_REASONING_EFFORT,
+        mode=SelectSelectorMode.DROPDOWN,
+    )
+)
+
+# The advanced step is static; current values are filled in as suggested values.
+ADVANCED_STEP_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_CHAT_MODEL,
+            default=RECOMMENDED_CHAT_MODEL,
+        ): _CHAT_MODEL_SELECTOR,
+        vol.Optional(
+            CONF_MAX_TOKENS,
+            default=RECOMMENDED_MAX_TOKENS,
+        ): int,
+        vol.Optional(
+            CONF_TOP_P,
+            default=RECOMMENDED_TOP_P,
+        ): _TOP_P_SELECTOR,
+        vol.Optional(
+            CONF_TEMPERATURE,
+            default=RECOMMENDED_TEMPERATURE,
+        ): _TEMPERATURE_SELECTOR,
+        vol.Optional(
+            CONF_REASONING_EFFORT,
+            default=RECOMMENDED_REASONING_EFFORT,
+        ): _REASONING_EFFORT_SELECTOR,
+    }
+)
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> None:
     """Validate the credentials."""
     client = MistralClient(data[CONF_API_KEY], get_async_client(hass))
-    payload = {
-        "model": RECOMMENDED_CHAT_MODEL,
-        "messages": [{"role": "user", "content": "ping"}],
-        "max_tokens": 1,
-        "stream": False,
-    }
-    await client.chat(payload)
+    await client.validate_api_key()
 
 
 class MistralConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -116,9 +142,16 @@ class MistralConfigFlow(ConfigFlow, domain=DOMAIN):
         self._async_abort_entries_match(user_input)
         try:
             await validate_input(self.hass, user_input)
+        except httpx.HTTPStatusError as err:
+            if err.response.status_code == 401:
+                errors["base"] = "invalid_auth"
+            else:
+                errors["base"] = "cannot_connect"
+        except httpx.HTTPError:
+            errors["base"] = "cannot_connect"
         except Exception:
             _LOGGER.exception("Unexpected exception while validating credentials")
-            errors["base"] = "cannot_connect"
+            errors["base"] = "unknown"
         else:
             return self.async_create_entry(
                 title=title,
@@ -126,13 +159,13 @@ class MistralConfigFlow(ConfigFlow, domain=DOMAIN):
                 subentries=[
                     {
                         "subentry_type": "conversation",
-                        "data": RECOMMENDED_CONVERSATION_OPTIONS,
+                        "data": dict(RECOMMENDED_CONVERSATION_OPTIONS),
                         "title": DEFAULT_CONVERSATION_NAME,
                         "unique_id": None,
                     },
                     {
                         "subentry_type": "ai_task_data",
-                        "data": RECOMMENDED_AI_TASK_OPTIONS,
+                        "data": dict(RECOMMENDED_AI_TASK_OPTIONS),
                         "title": DEFAULT_AI_TASK_NAME,
                         "unique_id": None,
                     },
@@ -161,6 +194,8 @@ class MistralSubentryFlowHandler(ConfigSubentryFlow):
     """Handle conversation and ai_task subentries."""
 
     options: dict[str, Any]
+    # LLM API options, listed once per flow and reused on re-renders
+    _hass_apis: list[SelectOptionDict] | None = None
 
     @property
     def _is_new(self) -> bool:
@@ -171,9 +206,9 @@ class MistralSubentryFlowHandler(ConfigSubentryFlow):
     ) -> SubentryFlowResult:
         """Handle creating a new subentry."""
         if self._subentry_type == "ai_task_data":
-            self.options = RECOMMENDED_AI_TASK_OPTIONS.copy()
+            self.options = dict(RECOMMENDED_AI_TASK_OPTIONS)
         else:
-            self.options = RECOMMENDED_CONVERSATION_OPTIONS.copy()
+            self.options = dict(RECOMMENDED_CONVERSATION_OPTIONS)
         return await self.async_step_init()
 
     async def async_step_reconfigure(
@@ -192,10 +227,12 @@ class MistralSubentryFlowHandler(ConfigSubentryFlow):
             return self.async_abort(reason="entry_not_loaded")
 
         options = self.options
-        hass_apis: list[SelectOptionDict] = [
-            SelectOptionDict(label=api.name, value=api.id)
-            for api in llm.async_get_apis(self.hass)
-        ]
+        if self._hass_apis is None:
+            self._hass_apis = [
+                SelectOptionDict(label=api.name, value=api.id)
+                for api in llm.async_get_apis(self.hass)
+            ]
+        hass_apis = self._hass_apis
 
         step_schema: VolDictType = {}
 
@@ -214,13 +251,7 @@ class MistralSubentryFlowHandler(ConfigSubentryFlow):
                     description={
                         "suggested_value": options.get(CONF_CHAT_MODEL, RECOMMENDED_CHAT_MODEL)
                     },
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=CHAT_MODELS,
-                        mode=SelectSelectorMode.DROPDOWN,
-                        custom_value=True,
-                    )
-                ),
+                ): _CHAT_MODEL_SELECTOR,
                 vol.Optional(
                     CONF_PROMPT,
                     description={
@@ -228,7 +259,7 @@ class MistralSubentryFlowHandler(ConfigSubentryFlow):
                             CONF_PROMPT, llm.DEFAULT_INSTRUCTIONS_PROMPT
                         )
                     },
-                ): TemplateSelector(),
+                ): _PROMPT_SELECTOR,
                 vol.Optional(CONF_LLM_HASS_API): SelectSelector(
                     SelectSelectorConfig(options=hass_apis, multiple=True)
                 ),
@@ -238,29 +269,7 @@ class MistralSubentryFlowHandler(ConfigSubentryFlow):
                     description={
                         "suggested_value": options.get(CONF_DEFAULT_MEDIA_PLAYER, DEFAULT_VOICE_BOX)
                     },
-                ): EntitySelector(
-                    EntitySelectorConfig(domain="media_player")
-                ),
-                vol.Required(
-                    CONF_RECOMMENDED,
-                    default=options.get(CONF_RECOMMENDED, True),
-                ): bool,
-            }
-        )
-
-        step_schema.update(
-            {
-                vol.Optional(
-                    CONF_PROMPT,
-                    description={
-                        "suggested_value": options.get(
-                            CONF_PROMPT, llm.DEFAULT_INSTRUCTIONS_PROMPT
-                        )
-                    },
-                ): TemplateSelector(),
-                vol.Optional(CONF_LLM_HASS_API): SelectSelector(
-                    SelectSelectorConfig(options=hass_apis, multiple=True)
-                ),
+                ): _MEDIA_PLAYER_SELECTOR,
                 vol.Required(
                     CONF_RECOMMENDED,
                     default=options.get(CONF_RECOMMENDED, True),
@@ -303,41 +312,6 @@ class MistralSubentryFlowHandler(ConfigSubentryFlow):
         options = self.options
         errors: dict[str, str] = {}
 
-        step_schema: VolDictType = {
-            vol.Optional(
-                CONF_CHAT_MODEL,
-                default=options.get(CONF_CHAT_MODEL, RECOMMENDED_CHAT_MODEL),
-            ): SelectSelector(
-                SelectSelectorConfig(
-                    options=CHAT_MODELS, # Nutzt unsere Liste aus const.py
-                    mode=SelectSelectorMode.DROPDOWN,
-                    custom_value=True, # Erlaubt trotzdem eigene Eingaben, falls Mistral ein neues Modell bringt
-                )
-            ),
-            vol.Optional(
-                CONF_MAX_TOKENS,
-                default=options.get(CONF_MAX_TOKENS, RECOMMENDED_MAX_TOKENS),
-            ): int,
-            vol.Optional(
-                CONF_TOP_P,
-                default=options.get(CONF_TOP_P, RECOMMENDED_TOP_P),
-            ): NumberSelector(NumberSelectorConfig(min=0, max=1, step=0.05)),
-            vol.Optional(
-                CONF_TEMPERATURE,
-                default=options.get(CONF_TEMPERATURE, RECOMMENDED_TEMPERATURE),
-            ): NumberSelector(NumberSelectorConfig(min=0, max=2, step=0.05)),
-            vol.Optional(
-                CONF_REASONING_EFFORT,
-                default=options.get(CONF_REASONING_EFFORT, RECOMMENDED_REASONING_EFFORT),
-            ): SelectSelector(
-                SelectSelectorConfig(
-                    options=["low", "medium", "high"],
-                    translation_key=CONF_REASONING_EFFORT,
-                    mode=SelectSelectorMode.DROPDOWN,
-                )
-            ),
-        }
-
         if user_input is not None:
             options.update(user_input)
             if user_input.get(CONF_CHAT_MODEL) in UNSUPPORTED_MODELS:
@@ -361,7 +335,7 @@ class MistralSubentryFlowHandler(ConfigSubentryFlow):
         return self.async_show_form(
             step_id="advanced",
             data_schema=self.add_suggested_values_to_schema(
-                vol.Schema(step_schema),
+                ADVANCED_STEP_SCHEMA,
                 options,
             ),
             errors=errors,
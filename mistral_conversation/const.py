@@ -1,6 +1,8 @@
 # Modified by Louis Rokitta
 """Constants for the Mistral AI Conversation integration."""
 
+from types import MappingProxyType
+
 from homeassistant.const import CONF_LLM_HASS_API
 from homeassistant.helpers import llm
 import logging
@@ -26,7 +28,7 @@ CONF_MUSIC_ASSISTANT_CONFIG_ENTRY = "music_assistant_config_entry"
 DEFAULT_MUSIC_ASSISTANT_CONFIG_ENTRY = None
 
 # Liste der verfügbaren Modelle für das Dropdown
-CHAT_MODELS = [
+CHAT_MODELS: tuple[str, ...] = (
     "mistral-large-latest",
     "mistral-medium-latest",
     "mistral-small-latest",
@@ -34,7 +36,7 @@ CHAT_MODELS = [
     "open-mixtral-8x7b",
     "open-mixtral-8x22b",
     "pixtral-12b-latest",
-]
+)
 
 RECOMMENDED_CHAT_MODEL = "mistral-large-latest"
 RECOMMENDED_MAX_TOKENS = 4096
@@ -48,16 +50,17 @@ DEFAULT_SYSTEM_PROMPT = (
 )
 MAX_TOOL_ITERATIONS = 5
 
-UNSUPPORTED_MODELS: list[str] = []
-WEB_SEARCH_MODELS: list[str] = []
+UNSUPPORTED_MODELS: frozenset[str] = frozenset()
+WEB_SEARCH_MODELS: frozenset[str] = frozenset()
 
-RECOMMENDED_CONVERSATION_OPTIONS = {
+# Read-only; take a dict() copy before handing them to a flow or entry.
+RECOMMENDED_CONVERSATION_OPTIONS = MappingProxyType({
     CONF_RECOMMENDED: True,
     CONF_LLM_HASS_API: [llm.LLM_API_ASSIST],
     CONF_PROMPT: llm.DEFAULT_INSTRUCTIONS_PROMPT,
     CONF_DEFAULT_MEDIA_PLAYER: DEFAULT_VOICE_BOX, # Neu hinzugefügt
     CONF_CHAT_MODEL: RECOMMENDED_CHAT_MODEL,
-}
-RECOMMENDED_AI_TASK_OPTIONS = {
+})
+RECOMMENDED_AI_TASK_OPTIONS = MappingProxyType({
     CONF_RECOMMENDED: True,
-}
+})
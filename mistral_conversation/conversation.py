@@ -40,6 +40,8 @@ class MistralConversationEntity(
 
     def __init__(self, entry: ConfigEntry, subentry: ConfigSubentry) -> None:
         super().__init__(entry, subentry)
+        # Subentry data only changes through a reload, which rebuilds the entity
+        self._prompt = subentry.data.get(CONF_PROMPT, DEFAULT_SYSTEM_PROMPT)
         if subentry.data.get(CONF_LLM_HASS_API):
             self._attr_supported_features = (
                 conversation.ConversationEntityFeature.CONTROL
@@ -67,7 +69,7 @@ class MistralConversationEntity(
             await chat_log.async_provide_llm_data(
                 user_input.as_llm_context(DOMAIN),
                 options.get(CONF_LLM_HASS_API),
-                options.get(CONF_PROMPT, DEFAULT_SYSTEM_PROMPT),
+                self._prompt,
                 user_input.extra_system_prompt,
             )
         except conversation.ConverseError as err:
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import secrets
 import string
-import re
 from datetime import datetime, date, time
-from typing import Any, AsyncIterator, Callable, Iterable, Dict
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Dict
 
+import orjson
 from voluptuous_openapi import convert
 
 from homeassistant.components import conversation
@@ -20,6 +20,7 @@ from homeassistant.helpers.entity import Entity
 
 from .const import (
     CONF_CHAT_MODEL,
+    CONF_TEMPERATURE,
     DEFAULT_NAME,
     LOGGER,
     MAX_TOOL_ITERATIONS,
@@ -31,7 +32,85 @@ from .const import (
 )
 from .mistral_client import MistralClient
 
-_MISTRAL_ID_RE = re.compile(r"^[A-Za-z0-9]{9}$")
+_ID_ALPHABET = string.ascii_letters + string.digits
+_MISTRAL_ID_LENGTH = 9
+# Shared read-only stand-in for missing stream deltas; never mutated
+_EMPTY: dict[str, Any] = {}
+
+_MUSIC_TOOLS: tuple[dict, ...] = (
+    {
+        "type": "function",
+        "function": {
+            "name": "music_assistant.search",
+            "description": "Suche nach Musik.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Suchbegriff"},
+                    "limit": {"type": "integer", "default": 1}
+                },
+                "required": ["name"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "music_assistant.play_media",
+            "description": "Spielt Musik ab.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "entity_id": {"type": "string", "description": "Player ID"},
+                    "media_id": {"type": "string", "description": "Media ID"},
+                    "media_type": {"type": "string", "description": "track/album"}
+                },
+                "required": ["media_id", "media_type"]
+            }
+        }
+    },
+)
+_MUSIC_TOOL_NAMES = frozenset(tool["function"]["name"] for tool in _MUSIC_TOOLS)
+# Arguments passed through to each Music Assistant service
+_MA_ALLOWED_ARGS: dict[str, frozenset[str]] = {
+    "play_media": frozenset({"media_id", "media_type"}),
+    "search": frozenset({"name", "limit", "media_type", "artist"}),
+    "get_library": frozenset({"media_type", "limit", "offset", "order_by"}),
+}
+# Services that take the Music Assistant config_entry_id
+_MA_CONFIG_ENTRY_SERVICES = frozenset({"search", "get_library"})
+
+async def _ma_play_media(
+    hass: HomeAssistant, service: str, args: dict[str, Any], entity_id: str | None
+) -> dict[str, Any]:
+    """Start playback on a player; play_media doesn't return a response."""
+    await hass.services.async_call(
+        "music_assistant",
+        service,
+        args,
+        target={"entity_id": entity_id},
+        blocking=True
+    )
+    return {"status": "success", "message": "Playback started"}
+
+async def _ma_call_with_response(
+    hass: HomeAssistant, service: str, args: dict[str, Any], entity_id: str | None
+) -> Any:
+    """Call a Music Assistant service and return its response."""
+    return await hass.services.async_call(
+        "music_assistant",
+        service,
+        args,
+        blocking=True,
+        return_response=True
+    )
+
+# Services that need something other than _ma_call_with_response
+_MA_HANDLERS: dict[
+    str, Callable[[HomeAssistant, str, dict[str, Any], str | None], Awaitable[Any]]
+] = {
+    "play_media": _ma_play_media,
+}
 
 def _json_default(obj: Any) -> Any:
     """JSON serializer fallback for types not natively supported."""
@@ -41,87 +120,178 @@ def _json_default(obj: Any) -> Any:
         return obj.decode("utf-8", errors="replace")
     return str(obj)
 
+def _dumps(obj: Any) -> str:
+    """Serialize tool arguments and results for the Mistral API."""
+    return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
 def _gen_mistral_id() -> str:
-    alphabet = string.ascii_letters + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(9))
+    # One CSPRNG read per id; bytes >= 248 (4 * 62) are dropped to keep it unbiased
+    chars: list[str] = []
+    while len(chars) < _MISTRAL_ID_LENGTH:
+        chars.extend(_ID_ALPHABET[b % 62] for b in secrets.token_bytes(16) if b < 248)
+    return "".join(chars[:_MISTRAL_ID_LENGTH])
 
-def _normalize_outgoing_tool_id(orig_id: str | None, id_map: Dict[str, str]) -> str:
+def _normalize_outgoing_tool_id(
+    orig_id: str | None, id_map: Dict[str, str], reverse_id_map: Dict[str, str]
+) -> str:
     if orig_id is None: orig_id = ""
-    if _MISTRAL_ID_RE.match(orig_id): return orig_id
+    # Mistral ids are exactly nine ASCII letters or digits
+    if len(orig_id) == 9 and orig_id.isascii() and orig_id.isalnum(): return orig_id
     if orig_id in id_map: return id_map[orig_id]
     new_id = _gen_mistral_id()
-    while new_id in id_map.values(): new_id = _gen_mistral_id()
+    # reverse_id_map is keyed by every Mistral id handed out so far
+    while new_id in reverse_id_map: new_id = _gen_mistral_id()
     id_map[orig_id] = new_id
+    reverse_id_map[new_id] = orig_id
     return new_id
 
-def _format_tool(tool: llm.Tool, serializer: Callable[[Any], Any] | None) -> dict:
-    return {
+def _format_tool(
+    tool: llm.Tool, serializer: Callable[[Any], Any] | None
+) -> orjson.Fragment:
+    """Encode a tool schema once, for reuse by every request in the turn."""
+    return orjson.Fragment(orjson.dumps({
         "type": "function",
         "function": {
             "name": tool.name,
             "description": tool.description or "",
             "parameters": convert(
-                tool.parameters,
-                custom_serializer=serializer or llm.selector_serializer,
+                tool.parameters, custom_serializer=serializer or llm.selector_serializer
             ),
         },
+    }))
+
+def _convert_tool_result(
+    content: conversation.ToolResultContent, id_map: Dict[str, str], reverse_id_map: Dict[str, str]
+) -> dict | None:
+    return {
+        "role": "tool",
+        "tool_call_id": _normalize_outgoing_tool_id(content.tool_call_id, id_map, reverse_id_map),
+        "name": content.tool_name,
+        "content": _dumps(content.tool_result),
     }
 
-def _convert_chat_content(content: conversation.Content, id_map: Dict[str, str]) -> list[dict]:
-    if isinstance(content, conversation.ToolResultContent):
-        return [{
-            "role": "tool",
-            "tool_call_id": _normalize_outgoing_tool_id(content.tool_call_id, id_map),
-            "name": content.tool_name,
-            "content": json.dumps(content.tool_result, default=_json_default, ensure_ascii=False),
-        }]
-    if isinstance(content, conversation.AssistantContent):
-        msg: dict[str, Any] = {"role": "assistant"}
-        if content.content: msg["content"] = content.content
-        if content.tool_calls:
-            msg["tool_calls"] = [{
-                "id": _normalize_outgoing_tool_id(tc.id, id_map),
-                "type": "function",
-                "function": {"name": tc.tool_name, "arguments": json.dumps(tc.tool_args, default=_json_default, ensure_ascii=False)},
-            } for tc in content.tool_calls]
-        return [msg]
-    return [{"role": content.role, "content": content.content}] if content.content else []
-
-def _build_messages(chat_content: Iterable[conversation.Content], id_map: Dict[str, str]) -> list[dict]:
-    messages: list[dict] = []
-    for content in chat_content:
-        messages.extend(_convert_chat_content(content, id_map))
-    return messages
+def _convert_assistant_content(
+    content: conversation.AssistantContent, id_map: Dict[str, str], reverse_id_map: Dict[str, str]
+) -> dict | None:
+    msg: dict[str, Any] = {"role": "assistant"}
+    if content.content: msg["content"] = content.content
+    if content.tool_calls:
+        msg["tool_calls"] = [{
+            "id": _normalize_outgoing_tool_id(tc.id, id_map, reverse_id_map),
+            "type": "function",
+            "function": {"name": tc.tool_name, "arguments": _dumps(tc.tool_args)},
+        } for tc in content.tool_calls]
+    return msg
+
+def _convert_plain_content(
+    content: conversation.Content, id_map: Dict[str, str], reverse_id_map: Dict[str, str]
+) -> dict | None:
+    return {"role": content.role, "content": content.content} if content.content else None
+
+# Converters by exact content type; subclasses fall back to an isinstance scan
+_CONVERTERS: dict[type, Callable[[Any, Dict[str, str], Dict[str, str]], dict | None]] = {
+    conversation.ToolResultContent: _convert_tool_result,
+    conversation.AssistantContent: _convert_assistant_content,
+}
+
+def _convert_chat_content(
+    content: conversation.Content, id_map: Dict[str, str], reverse_id_map: Dict[str, str]
+) -> dict | None:
+    """Convert one chat log entry to a Mistral message, or None to skip it."""
+    converter = _CONVERTERS.get(type(content))
+    if converter is None:
+        converter = next(
+            (conv for cls, conv in _CONVERTERS.items() if isinstance(content, cls)),
+            _convert_plain_content,
+        )
+    return converter(content, id_map, reverse_id_map)
+
+def _build_messages(
+    chat_content: Iterable[conversation.Content],
+    id_map: Dict[str, str],
+    reverse_id_map: Dict[str, str],
+) -> Iterator[dict]:
+    """Lazily convert chat log entries; callers extend the message list directly."""
+    return (
+        message
+        for content in chat_content
+        if (message := _convert_chat_content(content, id_map, reverse_id_map)) is not None
+    )
+
+def _tool_input_from_buffer(
+    buf: dict[str, Any], id_map: Dict[str, str], reverse_id_map: Dict[str, str]
+) -> llm.ToolInput:
+    args: Any = {}
+    # Name-only tool calls carry no argument fragments at all
+    if buf["arguments"]:
+        try: args = orjson.loads("".join(buf["arguments"]))
+        except orjson.JSONDecodeError:
+            LOGGER.warning("Failed to parse tool arguments for %s", buf["name"])
+    mistral_id = buf["id"]
+    if not mistral_id:
+        # Calls streamed without an id must not all share the empty id
+        mistral_id = _gen_mistral_id()
+        while mistral_id in reverse_id_map:
+            mistral_id = _gen_mistral_id()
+    int_id = reverse_id_map.get(mistral_id) or secrets.token_hex(8)
+    id_map[int_id] = mistral_id
+    reverse_id_map[mistral_id] = int_id
+    return llm.ToolInput(tool_name=buf["name"], tool_args=args, id=int_id)
 
 async def _transform_stream(
     stream: AsyncIterator[dict[str, Any]],
     id_map: Dict[str, str],
+    reverse_id_map: Dict[str, str],
+    finish_reasons: list[str] | None = None,
 ) -> AsyncIterator[conversation.AssistantContentDeltaDict]:
+    """Yield content deltas, and each tool call as soon as it is complete.
+
+    Tool calls may be yielded before the stream ends, so callers that act on
+    them should check that the last entry appended to finish_reasons is
+    "tool_calls".
+    """
     tool_call_buffers: dict[int, dict[str, Any]] = {}
+    # Local aliases for the per-chunk hot path
+    delta_dict = conversation.AssistantContentDeltaDict
+    tool_input = _tool_input_from_buffer
     async for chunk in stream:
-        for choice in chunk.get("choices", []):
-            delta = choice.get("delta") or {}
-            if "content" in delta and delta["content"]:
-                yield conversation.AssistantContentDeltaDict(content=delta["content"])
-            if "tool_calls" in delta:
-                for tc in delta["tool_calls"]:
+        choices = chunk.get("choices")
+        if not choices:
+            continue
+        for choice in choices:
+            delta = choice.get("delta") or _EMPTY
+            # Keep-alive chunks carry neither a delta nor a finish reason
+            if not delta and choice.get("finish_reason") is None:
+                continue
+            if content := delta.get("content"):
+                yield delta_dict(content=content)
+            if (tool_call_deltas := delta.get("tool_calls")) is not None:
+                for tc in tool_call_deltas:
                     idx = tc.get("index", 0)
-                    buf = tool_call_buffers.setdefault(idx, {"id": "", "name": "", "arguments": ""})
-                    if tc.get("id"): buf["id"] = tc["id"]
-                    fn = tc.get("function") or {}
-                    if fn.get("name"): buf["name"] = fn["name"]
-                    if fn.get("arguments"): buf["arguments"] += fn["arguments"]
-            if choice.get("finish_reason") == "tool_calls":
-                inputs = []
-                for idx in sorted(tool_call_buffers):
-                    buf = tool_call_buffers[idx]
-                    try: args = json.loads(buf["arguments"])
-                    except: args = {}
-                    int_id = next((k for k, v in id_map.items() if v == buf["id"]), secrets.token_hex(8))
-                    id_map[int_id] = buf["id"]
-                    inputs.append(llm.ToolInput(tool_name=buf["name"], tool_args=args, id=int_id))
+                    buf = tool_call_buffers.get(idx)
+                    if buf is None:
+                        # A new index means all earlier tool calls are complete
+                        for done in sorted(i for i in tool_call_buffers if i < idx):
+                            yield delta_dict(tool_calls=[
+                                tool_input(tool_call_buffers.pop(done), id_map, reverse_id_map)
+                            ])
+                        buf = tool_call_buffers[idx] = {"id": "", "name": "", "arguments": []}
+                    if tc_id := tc.get("id"): buf["id"] = tc_id
+                    fn = tc.get("function") or _EMPTY
+                    if name := fn.get("name"): buf["name"] = name
+                    if arguments := fn.get("arguments"): buf["arguments"].append(arguments)
+            if (finish_reason := choice.get("finish_reason")) is None:
+                continue
+            if finish_reasons is not None:
+                finish_reasons.append(finish_reason)
+            # Plain text completions never buffer tool calls, so skip the check
+            if tool_call_buffers and finish_reason == "tool_calls":
+                inputs = [
+                    tool_input(tool_call_buffers[idx], id_map, reverse_id_map)
+                    for idx in sorted(tool_call_buffers)
+                ]
                 tool_call_buffers.clear()
-                yield conversation.AssistantContentDeltaDict(tool_calls=inputs)
+                yield delta_dict(tool_calls=inputs)
 
 class MistralBaseLLMEntity(Entity):
     _attr_has_entity_name = True
@@ -130,11 +300,13 @@ class MistralBaseLLMEntity(Entity):
         self.entry = entry
         self.subentry = subentry
         self._attr_unique_id = subentry.subentry_id
+        # Subentry updates reload the entry, so the model is fixed per entity
+        self._model_name = subentry.data.get(CONF_CHAT_MODEL, RECOMMENDED_CHAT_MODEL)
         self._attr_device_info = dr.DeviceInfo(
             identifiers={(entry.domain, subentry.subentry_id)},
             name=entry.title or DEFAULT_NAME,
             manufacturer="Mistral AI",
-            model=subentry.data.get(CONF_CHAT_MODEL, RECOMMENDED_CHAT_MODEL),
+            model=self._model_name,
             entry_type=dr.DeviceEntryType.SERVICE,
         )
 
@@ -148,7 +320,7 @@ class MistralBaseLLMEntity(Entity):
 
     @property
     def client(self) -> MistralClient:
-        return self.entry.runtime_data
+        return self.entry.runtime_data.client
 
     def _options(self):
         return self.subentry.data or {}
@@ -161,6 +333,27 @@ class MistralBaseLLMEntity(Entity):
         """Add tool result content to chat log."""
         chat_log.content.append(content)
 
+    async def _async_call_standard_tool(
+        self, llm_api: llm.APIInstance, tool: llm.ToolInput
+    ) -> conversation.ToolResultContent:
+        """Call a Home Assistant tool and wrap its result or error."""
+        try:
+            result = await llm_api.async_call_tool(tool)
+        except AssertionError as e:
+            LOGGER.error(
+                "Standard tool '%s' raised AssertionError: %s", tool.tool_name, e
+            )
+            result = {"error": str(e)}
+        except Exception as e:
+            LOGGER.error("Standard tool '%s' failed: %s", tool.tool_name, e)
+            result = {"error": str(e)}
+        return conversation.ToolResultContent(
+            tool_call_id=tool.id,
+            tool_name=tool.tool_name,
+            tool_result=result,
+            agent_id=self.unique_id
+        )
+
     async def _async_handle_chat_log(
         self,
         hass: HomeAssistant,
@@ -170,10 +363,13 @@ class MistralBaseLLMEntity(Entity):
     ) -> conversation.AssistantContent:
         """Handle chat log and process tool calls."""
         options = self._options()
+        # Internal tool call id -> Mistral id, and the inverse for O(1) lookups
         id_map: Dict[str, str] = {}
+        reverse_id_map: Dict[str, str] = {}
         
         VOICE_BOX = options.get(CONF_DEFAULT_MEDIA_PLAYER, DEFAULT_VOICE_BOX)
-        CURRENT_MODEL = options.get(CONF_CHAT_MODEL, RECOMMENDED_CHAT_MODEL)
+        # Options are fixed for the turn, so resolve them before the tool loop
+        ma_config_entry_id = self._get_music_assistant_config_entry_id(hass)
     
         state = hass.states.get(VOICE_BOX)
         friendly_name = state.name if state else "dem Standard-Lautsprecher"
@@ -183,265 +379,251 @@ class MistralBaseLLMEntity(Entity):
             " Nutze für Musik-Befehle immer diesen Player."
         )
     
-        for iteration in range(MAX_TOOL_ITERATIONS):
-            messages = _build_messages(chat_log.content, id_map)
-            full_system_prompt = (structure_prompt + instruction) if structure_prompt else instruction
-            messages.insert(0, {"role": "system", "content": full_system_prompt})
-    
-            # Build tools list
-            tools = []
-            if chat_log.llm_api and chat_log.llm_api.tools:
-                tools = [_format_tool(t, chat_log.llm_api.custom_serializer) for t in chat_log.llm_api.tools]
-            
-            # Add Music Assistant tools (only if not already present)
-            music_tool_names = {"music_assistant.search", "music_assistant.play_media"}
-            existing_tool_names = {t.name for t in (chat_log.llm_api.tools if chat_log.llm_api else [])}
-            
-            if not music_tool_names.intersection(existing_tool_names):
-                tools.extend([
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": "music_assistant.search",
-                            "description": "Suche nach Musik.",
-                            "parameters": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Suchbegriff"},
-                                    "limit": {"type": "integer", "default": 1}
-                                },
-                                "required": ["name"]
-                            }
-                        }
-                    },
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": "music_assistant.play_media",
-                            "description": "Spielt Musik ab.",
-                            "parameters": {
-                                "type": "object",
-                                "properties": {
-                                    "entity_id": {"type": "string", "description": "Player ID"},
-                                    "media_id": {"type": "string", "description": "Media ID"},
-                                    "media_type": {"type": "string", "description": "track/album"}
-                                },
-                                "required": ["media_id", "media_type"]
-                            }
-                        }
-                    }
-                ])
-    
-            # Prepare API payload
-            payload = {
-                "model": CURRENT_MODEL,
-                "messages": messages,
-                "tools": tools,
-                "stream": use_streaming,
-            }
+        can_call_tools = chat_log.llm_api is not None and hasattr(
+            chat_log.llm_api, "async_call_tool"
+        )
+
+        # The system prompt and tool list do not change between iterations
+        full_system_prompt = (structure_prompt + instruction) if structure_prompt else instruction
+        system_message = {"role": "system", "content": full_system_prompt}
+
+        # Build tools list
+        tools = []
+        if chat_log.llm_api and chat_log.llm_api.tools:
+            tools = [_format_tool(t, chat_log.llm_api.custom_serializer) for t in chat_log.llm_api.tools]
+        
+        # Add Music Assistant tools (only if not already present)
+        existing_tool_names = {t.name for t in (chat_log.llm_api.tools if chat_log.llm_api else [])}
+        
+        if _MUSIC_TOOL_NAMES.isdisjoint(existing_tool_names):
+            tools.extend(_MUSIC_TOOLS)
+
+        messages = [system_message]
+        converted = 0
+
+        # Prepare API payload; each request is serialized before messages grows
+        payload = {
+            "model": self._model_name,
+            "messages": messages,
+            "tools": tools,
+            "stream": use_streaming,
+        }
+        if CONF_TEMPERATURE in options:
+            payload["temperature"] = options[CONF_TEMPERATURE]
+
+        # Standard tool calls started while the response is still streaming,
+        # keyed by id() of their ToolInput since model-supplied ids may repeat
+        pending_tools: dict[int, asyncio.Task[conversation.ToolResultContent]] = {}
+        try:
+            for iteration in range(MAX_TOOL_ITERATIONS):
+                # Only convert the chat log content added since the last iteration,
+                # encoding each message once instead of with every later request
+                messages.extend(
+                    orjson.Fragment(orjson.dumps(message))
+                    for message in _build_messages(
+                        chat_log.content[converted:], id_map, reverse_id_map
+                    )
+                )
+                converted = len(chat_log.content)
     
-            # Get response from Mistral
-            assistant_content = None
-            if use_streaming:
-                stream = self.client.chat_stream(payload)
-                content_text = ""
-                tool_calls = []
-                async for delta in _transform_stream(stream, id_map):
-                    if delta.get("content"): 
-                        content_text += delta["content"]
-                    if delta.get("tool_calls"): 
-                        tool_calls.extend(delta["tool_calls"])
+                # Get response from Mistral
+                assistant_content = None
+                if use_streaming:
+                    stream = self.client.chat_stream(payload)
+                    content_parts: list[str] = []
+                    tool_calls = []
+                    finish_reasons: list[str] = []
+                    try:
+                        async for delta in _transform_stream(
+                            stream, id_map, reverse_id_map, finish_reasons
+                        ):
+                            if delta.get("content"): 
+                                content_parts.append(delta["content"])
+                            if delta.get("tool_calls"): 
+                                tool_calls.extend(delta["tool_calls"])
+                                if can_call_tools:
+                                    for tool in delta["tool_calls"]:
+                                        if not tool.tool_name.startswith("music_assistant"):
+                                            pending_tools[id(tool)] = hass.async_create_task(
+                                                self._async_call_standard_tool(chat_log.llm_api, tool)
+                                            )
+                    except Exception:
+                        # Started calls may already have changed device state,
+                        # so record them and their results before failing the turn
+                        if started := [t for t in tool_calls if id(t) in pending_tools]:
+                            await self._add_assistant_content(chat_log, conversation.AssistantContent(
+                                content="".join(content_parts),
+                                tool_calls=started,
+                                agent_id=self.unique_id
+                            ))
+                            for result in await asyncio.gather(
+                                *(pending_tools.pop(id(t)) for t in started)
+                            ):
+                                await self._add_tool_content(chat_log, result)
+                        raise
+                    # Calls yielded early only count if the model finished with
+                    # them. Ones already started are kept with their results, as
+                    # they may have run; the rest are dropped like a buffered call.
+                    if tool_calls and finish_reasons[-1:] != ["tool_calls"]:
+                        started = [t for t in tool_calls if id(t) in pending_tools]
+                        LOGGER.warning(
+                            "Stream ended with %s; keeping %d of %d completed tool call(s) already started",
+                            finish_reasons[-1] if finish_reasons else "no finish reason",
+                            len(started),
+                            len(tool_calls),
+                        )
+                        tool_calls = started
                 
-                assistant_content = conversation.AssistantContent(
-                    content=content_text, 
-                    tool_calls=tool_calls, 
-                    agent_id=self.unique_id
-                )
-            else:
-                response = await self.client.chat(payload)
-                msg = response.get("choices", [{}])[0].get("message", {})
-                tcs = []
-                if msg.get("tool_calls"):
-                    for tc in msg["tool_calls"]:
-                        try: 
-                            args = json.loads(tc["function"]["arguments"])
-                        except (json.JSONDecodeError, KeyError, TypeError) as e:
-                            LOGGER.warning(f"Failed to parse tool arguments: {e}")
-                            args = {}
-                        tcs.append(llm.ToolInput(
-                            tool_name=tc["function"]["name"], 
-                            tool_args=args, 
-                            id=tc["id"]
-                        ))
-                assistant_content = conversation.AssistantContent(
-                    content=msg.get("content"), 
-                    tool_calls=tcs, 
-                    agent_id=self.unique_id
-                )
+                    assistant_content = conversation.AssistantContent(
+                        content="".join(content_parts), 
+                        tool_calls=tool_calls, 
+                        agent_id=self.unique_id
+                    )
+                else:
+                    response = await self.client.chat(payload)
+                    msg = response.get("choices", [{}])[0].get("message", {})
+                    tcs = []
+                    if msg.get("tool_calls"):
+                        for tc in msg["tool_calls"]:
+                            try: 
+                                args = orjson.loads(tc["function"]["arguments"])
+                            except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+                                LOGGER.warning("Failed to parse tool arguments: %s", e)
+                                args = {}
+                            tcs.append(llm.ToolInput(
+                                tool_name=tc["function"]["name"], 
+                                tool_args=args, 
+                                # Mistral-format id, so it is sent back unchanged
+                                id=tc.get("id") or _gen_mistral_id()
+                            ))
+                    assistant_content = conversation.AssistantContent(
+                        content=msg.get("content"), 
+                        tool_calls=tcs, 
+                        agent_id=self.unique_id
+                    )
     
-            if not assistant_content: 
-                break
+                if not assistant_content: 
+                    break
     
-            # No tool calls → Return response directly
-            if not assistant_content.tool_calls:
-                await self._add_assistant_content(chat_log, assistant_content)
-                return assistant_content
+                # No tool calls → Return response directly
+                if not assistant_content.tool_calls:
+                    await self._add_assistant_content(chat_log, assistant_content)
+                    return assistant_content
     
-            # ============================================================
-            # Separate Music Assistant tools from standard tools
-            # ============================================================
+                # ============================================================
+                # Separate Music Assistant tools from standard tools
+                # ============================================================
             
-            music_tools = []
-            standard_tools = []
+                music_tools = []
+                standard_tools = []
             
-            for tool in assistant_content.tool_calls:
-                if tool.tool_name.startswith("music_assistant"):
-                    music_tools.append(tool)
-                else:
-                    standard_tools.append(tool)
+                for tool in assistant_content.tool_calls:
+                    if tool.tool_name.startswith("music_assistant"):
+                        music_tools.append(tool)
+                    else:
+                        standard_tools.append(tool)
             
-            # ============================================================
-            # Process Music Assistant tools
-            # ============================================================
+                # ============================================================
+                # Process Music Assistant tools
+                # ============================================================
             
-            if music_tools:
-                # Add assistant content with ONLY music tools
-                await self._add_assistant_content(chat_log, conversation.AssistantContent(
-                    content=assistant_content.content,
-                    tool_calls=music_tools,
-                    agent_id=self.unique_id
-                ))
-                
-                # Get Music Assistant config_entry_id
-                ma_config_entry_id = self._get_music_assistant_config_entry_id(hass)
+                if music_tools:
+                    # Add assistant content with ONLY music tools
+                    await self._add_assistant_content(chat_log, conversation.AssistantContent(
+                        content=assistant_content.content,
+                        tool_calls=music_tools,
+                        agent_id=self.unique_id
+                    ))
+
                 
-                # Execute each music tool individually
-                for tool in music_tools:
-                    try:
-                        service = tool.tool_name.split(".")[1]
-                        args = dict(tool.tool_args)
-                        eid = args.pop("entity_id", VOICE_BOX)
-                        
-                        # Add config_entry_id ONLY if we have it and service needs it
-                        if ma_config_entry_id and service in ["search", "get_library"]:
-                            args["config_entry_id"] = ma_config_entry_id
+                    # Execute each music tool individually
+                    for tool in music_tools:
+                        try:
+                            service = tool.tool_name.partition(".")[2]
+                            tool_args = tool.tool_args
+                            eid = tool_args.get("entity_id", VOICE_BOX)
                         
-                        # Filter arguments based on service
-                        if service == "play_media":
-                            args = {k: v for k, v in args.items() if k in ["media_id", "media_type"]}
-                            if "media_id" in args:
+                            # Filter arguments based on service
+                            if (allowed := _MA_ALLOWED_ARGS.get(service)) is not None:
+                                args = {k: tool_args[k] for k in allowed if k in tool_args}
+                            else:
+                                args = {k: v for k, v in tool_args.items() if k != "entity_id"}
+                            if service == "play_media" and "media_id" in args:
                                 args["media_id"] = str(args["media_id"])
-                        elif service == "search":
-                            allowed = ["name", "limit", "media_type", "artist"]
-                            if ma_config_entry_id:
-                                allowed.append("config_entry_id")
-                            args = {k: v for k, v in args.items() if k in allowed}
-                        elif service == "get_library":
-                            allowed = ["media_type", "limit", "offset", "order_by"]
-                            if ma_config_entry_id:
-                                allowed.append("config_entry_id")
-                            args = {k: v for k, v in args.items() if k in allowed}
                         
-                        # Call the service - play_media doesn't return response!
-                        if service == "play_media":
-                            await hass.services.async_call(
-                                "music_assistant", 
-                                service, 
-                                args,
-                                target={"entity_id": eid},
-                                blocking=True
-                            )
-                            res = {"status": "success", "message": "Playback started"}
-                        else:
-                            res = await hass.services.async_call(
-                                "music_assistant", 
-                                service, 
-                                args,
-                                blocking=True, 
-                                return_response=True
-                            )
-
-                        # Add tool result to chat log
-                        await self._add_tool_content(chat_log, conversation.ToolResultContent(
-                            tool_call_id=tool.id, 
-                            tool_name=tool.tool_name, 
-                            tool_result=res or {"status": "success"},
-                            agent_id=self.unique_id
-                        ))
+                            # Add config_entry_id ONLY if we have it and service needs it
+                            if ma_config_entry_id and service in _MA_CONFIG_ENTRY_SERVICES:
+                                args["config_entry_id"] = ma_config_entry_id
                         
-                    except Exception as e:
-                        LOGGER.error(f"Music Assistant tool '{tool.tool_name}' failed: {e}")
-                        await self._add_tool_content(chat_log, conversation.ToolResultContent(
-                            tool_call_id=tool.id, 
-                            tool_name=tool.tool_name, 
-                            tool_result={"error": str(e)},
-                            agent_id=self.unique_id
-                        ))
-            
-            # ============================================================
-            # Process standard Home Assistant tools
-            # ============================================================
-            
-            if standard_tools:
-                # Add assistant content with standard tools
-                await self._add_assistant_content(chat_log, conversation.AssistantContent(
-                    content=assistant_content.content if not music_tools else "",
-                    tool_calls=standard_tools,
-                    agent_id=self.unique_id
-                ))
-                
-                # Execute standard tools via llm_api
-                if chat_log.llm_api and hasattr(chat_log.llm_api, 'async_call_tool'):
-                    for tool in standard_tools:
-                        try:
-                            result = await chat_log.llm_api.async_call_tool(tool)
-                            await self._add_tool_content(chat_log, conversation.ToolResultContent(
-                                tool_call_id=tool.id,
-                                tool_name=tool.tool_name,
-                                tool_result=result,
-                                agent_id=self.unique_id
-                            ))
-                        except AssertionError as e:
-                            LOGGER.error(
-                                f"Standard tool '{tool.tool_name}' raised AssertionError: {e}"
-                            )
+                            handler = _MA_HANDLERS.get(service, _ma_call_with_response)
+                            res = await handler(hass, service, args, eid)
+
+                            # Add tool result to chat log
                             await self._add_tool_content(chat_log, conversation.ToolResultContent(
-                                tool_call_id=tool.id,
-                                tool_name=tool.tool_name,
-                                tool_result={"error": str(e)},
+                                tool_call_id=tool.id, 
+                                tool_name=tool.tool_name, 
+                                tool_result=res or {"status": "success"},
                                 agent_id=self.unique_id
                             ))
+                        
                         except Exception as e:
-                            LOGGER.error(f"Standard tool '{tool.tool_name}' failed: {e}")
+                            LOGGER.error("Music Assistant tool '%s' failed: %s", tool.tool_name, e)
                             await self._add_tool_content(chat_log, conversation.ToolResultContent(
-                                tool_call_id=tool.id,
-                                tool_name=tool.tool_name,
+                                tool_call_id=tool.id, 
+                                tool_name=tool.tool_name, 
                                 tool_result={"error": str(e)},
                                 agent_id=self.unique_id
                             ))
+            
+                # ============================================================
+                # Process standard Home Assistant tools
+                # ============================================================
+            
+                if standard_tools:
+                    # Add assistant content with standard tools
+                    await self._add_assistant_content(chat_log, conversation.AssistantContent(
+                        content=assistant_content.content if not music_tools else "",
+                        tool_calls=standard_tools,
+                        agent_id=self.unique_id
+                    ))
+                
+                    # Execute standard tools via llm_api
+                    if can_call_tools:
+                        # Tool calls of one turn are independent, so run them concurrently
+                        results = await asyncio.gather(*(
+                            pending_tools.pop(id(tool), None)
+                            or self._async_call_standard_tool(chat_log.llm_api, tool)
+                            for tool in standard_tools
+                        ))
+                        for result in results:
+                            await self._add_tool_content(chat_log, result)
                     
-                    # Nach Ausführung: continue für nächste Iteration
-                    continue
-                else:
-                    # Kein llm_api? Dann return
-                    return assistant_content
+                        # Nach Ausführung: continue für nächste Iteration
+                        continue
+                    else:
+                        # Kein llm_api? Dann return
+                        return assistant_content
             
-            # ============================================================
-            # Continue loop if we processed music tools
-            # ============================================================
+                # ============================================================
+                # Continue loop if we processed music tools
+                # ============================================================
             
-            if music_tools:
-                continue
+                if music_tools:
+                    continue
             
-            # No tools were processed
-            await self._add_assistant_content(chat_log, assistant_content)
-            return assistant_content
+                # No tools were processed
+                await self._add_assistant_content(chat_log, assistant_content)
+                return assistant_content
+        finally:
+            # A cancelled or failed turn must not leave service calls running
+            for task in pending_tools.values():
+                task.cancel()
     
         # ============================================================
         # Max iterations reached - return gracefully
         # ============================================================
         
-        LOGGER.warning(f"Max tool iterations ({MAX_TOOL_ITERATIONS}) reached")
+        LOGGER.warning("Max tool iterations (%s) reached", MAX_TOOL_ITERATIONS)
         
         # Return last assistant content if available
         if assistant_content:
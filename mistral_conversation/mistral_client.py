@@ -3,86 +3,254 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import gzip
+import hashlib
 import logging
+import random
+import time
 from typing import Any, AsyncIterator, Dict
 
 import httpx
+import orjson
+
+from .cache import LLMCache
 
 MISTRAL_API_URL = "https://api.mistral.ai/v1/chat/completions"
 MISTRAL_MODELS_URL = "https://api.mistral.ai/v1/models"
+# Request bodies above this size are gzip-compressed (level 1 is cheap and
+# captures most of the saving on JSON chat histories).
+GZIP_MIN_SIZE = 4096
+# Generic client errors a gateway may use to refuse a gzip body. They only
+# count as a rejection when the error names the encoding; 415 always does.
+GZIP_AMBIGUOUS_STATUSES = frozenset({400, 422})
+# Connecting should be quick; generating a long completion may not be
+CHAT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+VALIDATE_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+# Transient failures (rate limits, gateway errors, dropped connections) are
+# retried with exponential backoff and jitter, honouring Retry-After.
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 10.0
+RETRY_STATUSES = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
+# The config flow and the first entry setup validate the same key back to
+# back, so a successful check is remembered for a few minutes. Entries are
+# keyed by a digest of the key, never the key itself, and expire on lookup.
+VALIDATION_TTL = 300
+_VALIDATED_KEYS: Dict[bytes, float] = {}
 LOGGER = logging.getLogger(__name__)
 
 
+def _retry_delay(attempt: int, response: httpx.Response | None) -> float | None:
+    """Return the wait before the next attempt, or None to stop retrying."""
+    if response is not None and response.status_code not in RETRY_STATUSES:
+        return None
+    if attempt + 1 >= RETRY_ATTEMPTS:
+        return None
+    if response is not None:
+        try:
+            return min(float(response.headers["Retry-After"]), RETRY_MAX_DELAY)
+        except (KeyError, ValueError):
+            pass
+    delay = min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY)
+    return delay + random.uniform(0, RETRY_BASE_DELAY)
+
+
+async def _iter_sse_data(response: httpx.Response) -> AsyncIterator[bytearray]:
+    """Yield the payload of each SSE data line until the [DONE] marker.
+
+    Lines are framed on the raw bytes so the JSON parser gets them without
+    an intermediate str decode.
+    """
+    buf = bytearray()
+    async for raw in response.aiter_bytes():
+        buf.extend(raw)
+        start = 0
+        while (end := buf.find(b"\n", start)) != -1:
+            line_start, start = start, end + 1
+            # Match the prefix in place; only the payload itself is copied
+            if not buf.startswith(b"data: ", line_start, end):
+                continue
+            if buf[end - 1] == 0x0D:  # CRLF line ending
+                end -= 1
+            data = buf[line_start + 6:end]
+            if data == b"[DONE]":
+                return
+            yield data
+        del buf[:start]
+    # A final event is not required to end with a newline
+    if buf.startswith(b"data: ") and (data := buf[6:].rstrip()) != b"[DONE]":
+        yield data
+
+
 class MistralClient:
     """Wrapper around Mistral's chat endpoint."""
 
-    def __init__(self, api_key: str, http_client: httpx.AsyncClient) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        http_client: httpx.AsyncClient,
+        cache: LLMCache | None = None,
+    ) -> None:
         if not api_key:
             raise ValueError("API key required for Mistral client")
         if http_client is None:
             raise ValueError("HTTP client required for Mistral client")
         self.api_key = api_key
         self.http_client = http_client
+        # Request headers are fixed per client; httpx only reads them
+        self._auth_headers = {"Authorization": f"Bearer {api_key}"}
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
+        self._gzip_headers = {**self._json_headers, "Content-Encoding": "gzip"}
+        self.cache = cache
+        # Set once a request through http_client has reached the API
+        self._connected = False
+        # Switched off for the client's lifetime if the API rejects gzip bodies
+        self.compress_requests = True
+        # Set once a gzip body has been accepted, so later 4xx are real errors
+        self._compression_confirmed = False
 
     async def validate_api_key(self) -> None:
         """Validate the API key by listing models."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-        }
+        key_digest = hashlib.sha256(self.api_key.encode()).digest()
+        now = time.monotonic()
+        for digest in [d for d, expires in _VALIDATED_KEYS.items() if expires <= now]:
+            del _VALIDATED_KEYS[digest]
+        if key_digest in _VALIDATED_KEYS:
+            return
         response = await self.http_client.get(
             MISTRAL_MODELS_URL,
-            headers=headers,
-            timeout=10,
+            headers=self._auth_headers,
+            timeout=VALIDATE_TIMEOUT,
         )
         response.raise_for_status()
+        self._connected = True
+        _VALIDATED_KEYS[key_digest] = time.monotonic() + VALIDATION_TTL
+
+    async def warm_up(self) -> None:
+        """Open a connection ahead of the first chat request, unless one exists."""
+        if self._connected:
+            return
+        try:
+            await self.http_client.get(
+                MISTRAL_MODELS_URL,
+                headers=self._auth_headers,
+                timeout=VALIDATE_TIMEOUT,
+            )
+        except httpx.HTTPError as err:
+            LOGGER.debug("Could not preconnect to the Mistral API: %s", err)
+            return
+        self._connected = True
+
+    def _request_body(self, payload: Dict[str, Any]) -> tuple[bytes, Dict[str, str]]:
+        """Encode a payload, compressing it when large enough to pay off."""
+        # orjson writes compact UTF-8 bytes directly, with no str round-trip
+        body = orjson.dumps(payload)
+        if self.compress_requests and len(body) > GZIP_MIN_SIZE:
+            return gzip.compress(body, compresslevel=1), self._gzip_headers
+        return body, self._json_headers
+
+    async def _compression_rejected(
+        self, response: httpx.Response, headers: Dict[str, str]
+    ) -> bool:
+        """Disable request compression if the API refused a gzip body."""
+        if "Content-Encoding" not in headers or self._compression_confirmed:
+            return False
+        status = response.status_code
+        if status in GZIP_AMBIGUOUS_STATUSES:
+            # Error bodies are small; only an encoding complaint is a rejection
+            body = (await response.aread()).lower()
+            if b"encoding" not in body and b"gzip" not in body:
+                return False
+        elif status != 415:
+            if response.is_success:
+                self._compression_confirmed = True
+            return False
+        LOGGER.debug(
+            "Mistral API answered a gzip request body with %s, sending uncompressed",
+            status,
+        )
+        self.compress_requests = False
+        return True
 
     async def chat(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Send a chat payload to Mistral."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-        response = await self.http_client.post(
-            MISTRAL_API_URL,
-            json=payload,
-            headers=headers,
-            timeout=60,
-        )
+        key = self.cache.cache_key(payload) if self.cache else None
+        if key is not None and (cached := self.cache.get(key)) is not None:
+            return cached
+        attempt = 0
+        while True:
+            body, headers = self._request_body(payload)
+            try:
+                response = await self.http_client.post(
+                    MISTRAL_API_URL,
+                    content=body,
+                    headers=headers,
+                    timeout=CHAT_TIMEOUT,
+                )
+            except httpx.TransportError:
+                if (delay := _retry_delay(attempt, None)) is None:
+                    raise
+            else:
+                if await self._compression_rejected(response, headers):
+                    continue
+                if (delay := _retry_delay(attempt, response)) is None:
+                    break
+            attempt += 1
+            LOGGER.debug("Retrying Mistral request in %.1f s", delay)
+            await asyncio.sleep(delay)
         response.raise_for_status()
-        return response.json()
+        result = orjson.loads(response.content)
+        if key is not None:
+            self.cache.set(key, result)
+        return result
 
     def chat_stream(self, payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
         """Send a chat payload to Mistral and stream the response.
         
         Returns an async iterator that yields response chunks from the Mistral API.
         Usage: async for chunk in client.chat_stream(payload): ...
+        Deterministic requests replay the chunks of a completed earlier stream.
         """
+        key = self.cache.cache_key(payload) if self.cache else None
+
         async def _stream() -> AsyncIterator[Dict[str, Any]]:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            }
-            async with self.http_client.stream(
-                "POST",
-                MISTRAL_API_URL,
-                json=payload,
-                headers=headers,
-                timeout=60,
-            ) as response:
-                response.raise_for_status()
-                async for line in response.aiter_lines():
-                    line = line.strip()
-                    if not line:
-                        continue
-                    if line.startswith("data: "):
-                        data = line[6:]  # Remove "data: " prefix
-                        if data == "[DONE]":
-                            break
-                        try:
-                            chunk = json.loads(data)
-                            yield chunk
-                        except json.JSONDecodeError:
-                            LOGGER.warning("Failed to parse SSE chunk: %s", data)
+            if key is not None and (cached := self.cache.get(key)) is not None:
+                for chunk in cached:
+                    yield chunk
+                return
+            chunks: list[Dict[str, Any]] = []
+            attempt = 0
+            while True:
+                body, headers = self._request_body(payload)
+                try:
+                    async with self.http_client.stream(
+                        "POST",
+                        MISTRAL_API_URL,
+                        content=body,
+                        headers=headers,
+                        timeout=CHAT_TIMEOUT,
+                    ) as response:
+                        if await self._compression_rejected(response, headers):
                             continue
+                        if (delay := _retry_delay(attempt, response)) is None:
+                            response.raise_for_status()
+                            async for data in _iter_sse_data(response):
+                                try:
+                                    chunk = orjson.loads(data)
+                                except orjson.JSONDecodeError:
+                                    LOGGER.warning("Failed to parse SSE chunk: %s", data)
+                                    continue
+                                chunks.append(chunk)
+                                yield chunk
+                            break
+                except httpx.TransportError:
+                    # Once chunks reached the caller a retry would repeat them
+                    if chunks or (delay := _retry_delay(attempt, None)) is None:
+                        raise
+                attempt += 1
+                LOGGER.debug("Retrying Mistral stream in %.1f s", delay)
+                await asyncio.sleep(delay)
+            if key is not None:
+                self.cache.set(key, chunks)
         return _stream()